@@ -3,7 +3,9 @@ Authentication utilities for JWT token management and password hashing
 Implementing secure authentication following best practices
 """
 
+import hashlib
 import os
+from cachetools import TTLCache
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -22,7 +24,17 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2 is the primary scheme (~3-5x faster than bcrypt at equivalent security);
+# bcrypt stays registered so existing hashes keep verifying and get re-hashed on login
+# Cost parameters are env-tunable so test runs can drop to cheap hashes
+# without changing algorithm identity; production keeps the defaults
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=int(os.getenv("ARGON2_TIME_COST", "2")),
+    argon2__memory_cost=int(os.getenv("ARGON2_MEMORY_COST", "19456")),
+    argon2__parallelism=1,
+)
 
 # JWT Bearer token security
 security = HTTPBearer()
@@ -36,6 +48,10 @@ class AuthManager:
         self.secret_key = SECRET_KEY
         self.algorithm = ALGORITHM
         self.token_expire_minutes = ACCESS_TOKEN_EXPIRE_MINUTES
+        # Short-lived cache of decoded tokens: every authenticated request
+        # repeats the same HMAC + JSON decode; the 60s TTL is well inside
+        # token lifetime so expiry enforcement stays close to exact
+        self._token_cache = TTLCache(maxsize=4096, ttl=60)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against its hash"""
@@ -63,6 +79,15 @@ class AuthManager:
 
     def verify_token(self, token: str) -> TokenData:
         """Verify and decode JWT token"""
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            token_data, expires_at = cached
+            # The cache entry carries the token's own exp so a token never
+            # outlives its expiry just because the cache slot is younger
+            if datetime.now(timezone.utc).timestamp() < expires_at:
+                return token_data
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             user_id = payload.get("user_id")
@@ -75,8 +100,12 @@ class AuthManager:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
             
-            return TokenData(user_id=user_id, username=username)
-        
+            token_data = TokenData(user_id=user_id, username=username)
+            expires_at = payload.get("exp")
+            if expires_at is not None:
+                self._token_cache[cache_key] = (token_data, expires_at)
+            return token_data
+
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -108,8 +137,10 @@ def get_current_user(
     """
     token = credentials.credentials
     token_data = auth_manager.verify_token(token)
-    
-    user = db.query(User).filter(User.user_id == token_data.user_id).first()
+
+    # PK lookup via Session.get: hits the identity map when the user was
+    # already loaded in this request and compiles to a simple PK select
+    user = db.get(User, token_data.user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
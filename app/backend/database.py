@@ -4,29 +4,139 @@ Using SQLAlchemy with PostgreSQL
 """
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from contextlib import contextmanager
+from functools import lru_cache
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import DeclarativeBase, selectinload, sessionmaker, Session
+from typing import AsyncGenerator, Generator
 
 # Database URL from environment variable
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-# SQLAlchemy engine configuration
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False  # Set to True for SQL query logging in development
-)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@lru_cache(maxsize=None)
+def get_engine():
+    """
+    Build the engine on first use instead of at import
+    Processes that import this module without touching the database
+    (schema-only tooling, scripts) skip driver import and pool setup
+
+    Pool sizing is env-tunable: the defaults cap out well below what a few
+    concurrent uvicorn workers need, and resizing must not require a deploy
+    Stale connections are handled by recycling under the typical 300s server
+    idle timeout instead of pre-ping, which costs a SELECT on every checkout;
+    set DB_PRE_PING=1 for deployments that kill connections unpredictably
+    When an external pooler (e.g. PgBouncer in transaction mode) fronts the
+    database, point DATABASE_URL at it and set DB_EXTERNAL_POOLER=1:
+    SQLAlchemy then hands connections straight through instead of
+    double-pooling
+    """
+    if os.getenv("DB_EXTERNAL_POOLER") == "1":
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "pool_size": int(os.getenv("SQLALCHEMY_POOL_SIZE", "20")),
+            "max_overflow": int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", "30")),
+            "pool_timeout": int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(os.getenv("SQLALCHEMY_POOL_RECYCLE", "280")),
+            "pool_pre_ping": os.getenv("DB_PRE_PING") == "1",
+        }
+
+    return create_engine(
+        DATABASE_URL,
+        echo=False,  # Set to True for SQL query logging in development
+        **pool_kwargs
+    )
+
+
+@lru_cache(maxsize=None)
+def get_sessionmaker():
+    """Session factory, bound lazily to the cached engine"""
+    # expire_on_commit=False keeps committed attributes readable without a
+    # reload SELECT; eager_defaults on the mappers already populates server
+    # defaults via RETURNING at flush time
+    return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine())
+
+
+def _async_database_url(url: str) -> str:
+    """Map the configured URL onto its non-blocking driver equivalent"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+@lru_cache(maxsize=None)
+def get_async_engine():
+    """
+    Async engine for handlers that must not block the event loop during
+    database round-trips (e.g. the health check's SELECT 1)
+    """
+    return create_async_engine(
+        _async_database_url(DATABASE_URL),
+        pool_pre_ping=os.getenv("DB_PRE_PING") == "1",
+        pool_recycle=280,
+        echo=False
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker():
+    """Async session factory, bound lazily to the cached async engine"""
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def __getattr__(name):
+    """Keep `from database import engine` and friends working lazily"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Base class for all models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base using SQLAlchemy 2.x typed mappings"""
+    pass
+
+
+@contextmanager
+def count_queries(engine) -> Generator[list, None, None]:
+    """
+    Opt-in diagnostic: collect the SQL statements an engine executes
+    Tests wrap a request and assert a query budget so N+1 regressions
+    fail loudly instead of silently degrading latency; cost is a list
+    append per statement, and nothing is registered outside the block
+    """
+    statements: list = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def eager(query, *relationships):
+    """
+    Chain selectinload options onto a query without boilerplate
+    Collapses N+1 lazy loads into one IN-clause batch per relationship:
+    db.query(Application) becomes eager(db.query(Application), Application.resume)
+    """
+    return query.options(*[selectinload(rel) for rel in relationships])
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -34,8 +144,17 @@ def get_db() -> Generator[Session, None, None]:
     Dependency function to get database session
     Ensures proper session cleanup
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session
+    Ensures proper session cleanup
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -3,8 +3,11 @@ Database models for the Job Application Management system
 Following SOLID principles with proper relationships
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import String, DateTime, Text, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from database import Base
 
@@ -12,18 +15,25 @@ from database import Base
 class User(Base):
     """User model for authentication and profile management"""
     __tablename__ = "users"
-
-    user_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    password_hashed = Column(String(255), nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_active = Column(Boolean, default=True)
+    # eager_defaults fetches server defaults (created_at) via RETURNING on
+    # insert instead of issuing a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    user_id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    password_hashed: Mapped[str] = mapped_column(String(255))
+    email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
 
     # Relationships
-    resumes = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
-    applications = relationship("Application", back_populates="user", cascade="all, delete-orphan")
+    resumes: Mapped[List["Resume"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
+    applications: Mapped[List["Application"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
 
     def __repr__(self):
         return f"<User(id={self.user_id}, username='{self.username}', email='{self.email}')>"
@@ -32,18 +42,26 @@ class User(Base):
 class Resume(Base):
     """Resume model for storing user resume data"""
     __tablename__ = "resumes"
-
-    resume_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
-    content = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    title = Column(String(200), nullable=False)
-    is_active = Column(Boolean, default=True)
+    # Matches the listing query's WHERE user_id AND is_active filter
+    __table_args__ = (
+        Index("ix_resume_user_active", "user_id", "is_active"),
+        # Covers keyset pagination: filter on user/activity, seek and order
+        # by (created_at, resume_id)
+        Index("ix_resume_user_active_created", "user_id", "is_active", "created_at", "resume_id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    resume_id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"))
+    content: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    title: Mapped[str] = mapped_column(String(200))
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
 
     # Relationships
-    user = relationship("User", back_populates="resumes")
-    applications = relationship("Application", back_populates="resume")
+    user: Mapped["User"] = relationship(back_populates="resumes")
+    applications: Mapped[List["Application"]] = relationship(back_populates="resume")
 
     def __repr__(self):
         return f"<Resume(id={self.resume_id}, user_id={self.user_id}, title='{self.title}')>"
@@ -52,22 +70,29 @@ class Resume(Base):
 class Application(Base):
     """Application model for job application tracking"""
     __tablename__ = "applications"
-
-    application_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
-    resume_id = Column(Integer, ForeignKey("resumes.resume_id"), nullable=True)
-    job_title = Column(String(200), nullable=False)
-    company = Column(String(200), nullable=False)
-    status = Column(String(50), nullable=False, default="applied")  # applied, interview, rejected, offered
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    job_description = Column(Text, nullable=True)
-    application_url = Column(String(500), nullable=True)
-    notes = Column(Text, nullable=True)
+    # Composite indexes matching the listing queries: filter by user_id plus
+    # status, and user_id ordered by created_at for pagination
+    __table_args__ = (
+        Index("ix_app_user_status", "user_id", "status"),
+        Index("ix_app_user_created", "user_id", "created_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    application_id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"))
+    resume_id: Mapped[Optional[int]] = mapped_column(ForeignKey("resumes.resume_id"))
+    job_title: Mapped[str] = mapped_column(String(200))
+    company: Mapped[str] = mapped_column(String(200))
+    status: Mapped[str] = mapped_column(String(50), default="applied")  # applied, interview, rejected, offered
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    job_description: Mapped[Optional[str]] = mapped_column(Text)
+    application_url: Mapped[Optional[str]] = mapped_column(String(500))
+    notes: Mapped[Optional[str]] = mapped_column(Text)
 
     # Relationships
-    user = relationship("User", back_populates="applications")
-    resume = relationship("Resume", back_populates="applications")
+    user: Mapped["User"] = relationship(back_populates="applications")
+    resume: Mapped[Optional["Resume"]] = relationship(back_populates="applications")
 
     def __repr__(self):
         return f"<Application(id={self.application_id}, job_title='{self.job_title}', company='{self.company}', status='{self.status}')>"
@@ -4,19 +4,26 @@ Handles CRUD operations for job applications
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from database import get_db
 from models import User, Application, Resume
-from schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationStatus
+from schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationStatus, from_orm_fast
+from schemas_fast import ApplicationResponseFast, ApplicationSummaryResponseFast, MsgspecJSONResponse, struct_from_orm
 from auth import get_current_active_user
 
 router = APIRouter()
 
 
-@router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
-async def create_application(
+# response_model is omitted on these trusted paths: the handlers return
+# schemas already built from rows we just wrote, so FastAPI's re-validation
+# pass would walk every field a second time for no benefit; the `responses`
+# mapping keeps the OpenAPI documentation intact
+@router.post("", status_code=status.HTTP_201_CREATED,
+             responses={status.HTTP_201_CREATED: {"model": ApplicationResponse}})
+def create_application(
     application_data: ApplicationCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -26,14 +33,15 @@ async def create_application(
     Validates resume ownership if resume_id is provided
     """
     try:
-        # Validate resume ownership if provided
+        # Validate resume ownership if provided; select only the key so the
+        # check is an index-only probe instead of hydrating the resume TEXT
         if application_data.resume_id:
-            resume = db.query(Resume).filter(
+            resume = db.query(Resume.resume_id).filter(
                 Resume.resume_id == application_data.resume_id,
                 Resume.user_id == current_user.user_id,
                 Resume.is_active == True
             ).first()
-            
+
             if not resume:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,7 +63,7 @@ async def create_application(
         db.commit()
         db.refresh(db_application)
         
-        return ApplicationResponse.from_orm(db_application)
+        return from_orm_fast(ApplicationResponse, db_application)
     
     except HTTPException:
         raise
@@ -67,31 +75,106 @@ async def create_application(
         )
 
 
+@router.post("/batch", status_code=status.HTTP_201_CREATED,
+             responses={status.HTTP_201_CREATED: {"model": List[ApplicationResponse]}})
+def create_applications_batch(
+    applications_data: List[ApplicationCreate],
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Create multiple job applications in one request
+    Validates all referenced resumes with a single query and commits once,
+    replacing per-item round-trips through auth, validation and the database
+    """
+    try:
+        # Validate resume ownership for all referenced resumes at once
+        resume_ids = {a.resume_id for a in applications_data if a.resume_id}
+        if resume_ids:
+            owned_ids = {
+                row[0]
+                for row in db.query(Resume.resume_id).filter(
+                    Resume.resume_id.in_(resume_ids),
+                    Resume.user_id == current_user.user_id,
+                    Resume.is_active == True
+                ).all()
+            }
+            if resume_ids - owned_ids:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid resume ID or resume not found"
+                )
+
+        db_applications = [
+            Application(
+                user_id=current_user.user_id,
+                resume_id=application_data.resume_id,
+                job_title=application_data.job_title,
+                company=application_data.company,
+                status=application_data.status,
+                job_description=application_data.job_description,
+                application_url=application_data.application_url,
+                notes=application_data.notes
+            )
+            for application_data in applications_data
+        ]
+
+        db.add_all(db_applications)
+        db.commit()
+
+        return [from_orm_fast(ApplicationResponse, app) for app in db_applications]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Application creation failed: {str(e)}"
+        )
+
+
 @router.get("", response_model=List[ApplicationResponse])
-async def get_user_applications(
+def get_user_applications(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     status_filter: Optional[ApplicationStatus] = Query(None),
-    company_filter: Optional[str] = Query(None)
+    company_filter: Optional[str] = Query(None),
+    summary: bool = Query(False)
 ):
     """
     Get all job applications for the current user
-    Supports pagination and filtering by status and company
+    Supports pagination and filtering by status and company;
+    summary=true omits the large TEXT columns from the projection
     """
     try:
-        query = db.query(Application).filter(Application.user_id == current_user.user_id)
-        
+        # Column-level select returns plain rows, skipping ORM object
+        # construction and identity-map bookkeeping for the list page;
+        # the summary projection also keeps job_description/notes TEXT
+        # off the wire entirely
+        struct_cls = ApplicationSummaryResponseFast if summary else ApplicationResponseFast
+        stmt = select(
+            *[getattr(Application, name) for name in struct_cls.__struct_fields__]
+        ).where(Application.user_id == current_user.user_id)
+
         if status_filter:
-            query = query.filter(Application.status == status_filter.value)
-        
+            stmt = stmt.where(Application.status == status_filter.value)
+
         if company_filter:
-            query = query.filter(Application.company.ilike(f"%{company_filter}%"))
-        
-        applications = query.order_by(Application.created_at.desc()).offset(skip).limit(limit).all()
-        
-        return [ApplicationResponse.from_orm(app) for app in applications]
+            stmt = stmt.where(Application.company.ilike(f"%{company_filter}%"))
+
+        rows = db.execute(
+            stmt.order_by(Application.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=50)
+        ).mappings().all()
+
+        # Returning a Response directly bypasses pydantic-core serialization;
+        # msgspec encodes the struct list straight to the HTTP body
+        return MsgspecJSONResponse([struct_cls(**row) for row in rows])
     
     except Exception as e:
         raise HTTPException(
@@ -100,8 +183,9 @@ async def get_user_applications(
         )
 
 
-@router.get("/{application_id}", response_model=ApplicationResponse)
-async def get_application(
+@router.get("/{application_id}",
+            responses={status.HTTP_200_OK: {"model": ApplicationResponse}})
+def get_application(
     application_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -122,7 +206,7 @@ async def get_application(
                 detail="Application not found"
             )
         
-        return ApplicationResponse.from_orm(application)
+        return from_orm_fast(ApplicationResponse, application)
     
     except HTTPException:
         raise
@@ -133,8 +217,9 @@ async def get_application(
         )
 
 
-@router.put("/{application_id}", response_model=ApplicationResponse)
-async def update_application(
+@router.put("/{application_id}",
+            responses={status.HTTP_200_OK: {"model": ApplicationResponse}})
+def update_application(
     application_id: int,
     application_update: ApplicationUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -159,7 +244,7 @@ async def update_application(
         # Validate resume ownership if resume_id is being updated
         if application_update.resume_id is not None:
             if application_update.resume_id != 0:  # 0 means remove resume association
-                resume = db.query(Resume).filter(
+                resume = db.query(Resume.resume_id).filter(
                     Resume.resume_id == application_update.resume_id,
                     Resume.user_id == current_user.user_id,
                     Resume.is_active == True
@@ -181,7 +266,7 @@ async def update_application(
         db.commit()
         db.refresh(application)
         
-        return ApplicationResponse.from_orm(application)
+        return from_orm_fast(ApplicationResponse, application)
     
     except HTTPException:
         raise
@@ -194,7 +279,7 @@ async def update_application(
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_application(
+def delete_application(
     application_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -228,7 +313,7 @@ async def delete_application(
 
 
 @router.get("/statistics/summary")
-async def get_application_statistics(
+def get_application_statistics(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -237,9 +322,20 @@ async def get_application_statistics(
     Provides insights into application patterns and success rates
     """
     try:
-        applications = db.query(Application).filter(Application.user_id == current_user.user_id).all()
-        
-        if not applications:
+        # Aggregate in SQL so only small count rows cross the wire instead
+        # of every application being hydrated just to be tallied in Python
+        owned = Application.user_id == current_user.user_id
+
+        # Status breakdown
+        status_counts = dict(
+            db.query(Application.status, func.count())
+            .filter(owned)
+            .group_by(Application.status)
+            .all()
+        )
+        total = sum(status_counts.values())
+
+        if not total:
             return {
                 "total_applications": 0,
                 "status_breakdown": {},
@@ -247,39 +343,40 @@ async def get_application_statistics(
                 "monthly_applications": {},
                 "success_rate": 0.0
             }
-        
-        # Status breakdown
-        status_counts = {}
-        for app in applications:
-            status = app.status
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+
         # Company breakdown (top 10)
-        company_counts = {}
-        for app in applications:
-            company = app.company
-            company_counts[company] = company_counts.get(company, 0) + 1
-        
-        top_companies = dict(sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        # Monthly breakdown (last 12 months)
-        from collections import defaultdict
-        monthly_counts = defaultdict(int)
-        for app in applications:
-            month_key = app.created_at.strftime("%Y-%m")
-            monthly_counts[month_key] += 1
-        
+        top_companies = dict(
+            db.query(Application.company, func.count())
+            .filter(owned)
+            .group_by(Application.company)
+            .order_by(func.count().desc())
+            .limit(10)
+            .all()
+        )
+
+        # Monthly breakdown; the YYYY-MM bucketing expression differs by dialect
+        if db.get_bind().dialect.name == "sqlite":
+            month_expr = func.strftime("%Y-%m", Application.created_at)
+        else:
+            month_expr = func.to_char(Application.created_at, "YYYY-MM")
+        monthly_counts = dict(
+            db.query(month_expr, func.count())
+            .filter(owned)
+            .group_by(month_expr)
+            .all()
+        )
+
         # Success rate calculation (offers / total applications)
         offers = status_counts.get("offered", 0)
-        success_rate = (offers / len(applications)) * 100 if applications else 0.0
-        
+        success_rate = (offers / total) * 100
+
         return {
-            "total_applications": len(applications),
+            "total_applications": total,
             "status_breakdown": status_counts,
             "company_breakdown": top_companies,
-            "monthly_applications": dict(monthly_counts),
+            "monthly_applications": monthly_counts,
             "success_rate": round(success_rate, 2),
-            "average_applications_per_month": round(len(applications) / 12, 2) if applications else 0
+            "average_applications_per_month": round(total / 12, 2)
         }
     
     except Exception as e:
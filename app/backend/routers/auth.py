@@ -9,66 +9,48 @@ from sqlalchemy.exc import IntegrityError
 
 from database import get_db
 from models import User
-from schemas import UserCreate, UserLogin, Token, UserResponse
+from schemas import UserCreate, UserLogin, Token, UserResponse, from_orm_fast
 from auth import auth_manager, get_current_user
 
 router = APIRouter()
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new user
     Creates a new user account with hashed password
     """
+    # The unique constraints on username and email are the source of truth,
+    # so the happy path is a single INSERT with no pre-check round-trips and
+    # duplicate detection stays race-free under concurrent signups
+    hashed_password = auth_manager.get_password_hash(user_data.password)
+    db_user = User(
+        username=user_data.username,
+        email=user_data.email,
+        password_hashed=hashed_password
+    )
+
+    db.add(db_user)
     try:
-        # Check if user already exists
-        existing_user = db.query(User).filter(
-            (User.username == user_data.username) | (User.email == user_data.email)
-        ).first()
-        
-        if existing_user:
-            if existing_user.username == user_data.username:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already registered"
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-        
-        # Create new user
-        hashed_password = auth_manager.get_password_hash(user_data.password)
-        db_user = User(
-            username=user_data.username,
-            email=user_data.email,
-            password_hashed=hashed_password
-        )
-        
-        db.add(db_user)
         db.commit()
-        db.refresh(db_user)
-        
-        return UserResponse.from_orm(db_user)
-    
     except IntegrityError:
         db.rollback()
+        # Attribute the conflict deterministically (username takes priority
+        # when both collide); this lookup only runs on the failure path
+        username_taken = db.query(User.user_id).filter(
+            User.username == user_data.username
+        ).first()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User registration failed due to data constraints"
-        )
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Registration failed: {str(e)}"
+            detail="Username already registered" if username_taken else "Email already registered"
         )
 
+    return from_orm_fast(UserResponse, db_user)
+
 
 @router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """
     User login endpoint
     Authenticates user and returns JWT token
@@ -115,7 +97,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(current_user: User = Depends(get_current_user)):
+def refresh_token(current_user: User = Depends(get_current_user)):
     """
     Refresh JWT token for authenticated user
     Generates a new token with extended expiration
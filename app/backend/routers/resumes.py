@@ -3,20 +3,44 @@ Resume management router
 Handles CRUD operations for user resumes
 """
 
+import base64
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import String, delete, tuple_, type_coerce, update
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
 from database import get_db
-from models import User, Resume
-from schemas import ResumeCreate, ResumeUpdate, ResumeResponse
+from models import User, Resume, Application
+from schemas import ResumeCreate, ResumeUpdate, ResumeResponse, from_orm_fast
+from schemas_fast import ResumeResponseFast, MsgspecJSONResponse, struct_from_orm
 from auth import get_current_active_user
 
 router = APIRouter()
 
 
+def _encode_cursor(resume) -> str:
+    """Opaque keyset cursor: (created_at, resume_id) of the last row served"""
+    raw = f"{resume.created_at.isoformat()},{resume.resume_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """Parse a cursor back into its (created_at, resume_id) keyset"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, resume_id = raw.partition(",")
+        return datetime.fromisoformat(created_at), int(resume_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.post("", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
-async def create_resume(
+def create_resume(
     resume_data: ResumeCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -34,9 +58,8 @@ async def create_resume(
         
         db.add(db_resume)
         db.commit()
-        db.refresh(db_resume)
         
-        return ResumeResponse.from_orm(db_resume)
+        return from_orm_fast(ResumeResponse, db_resume)
     
     except Exception as e:
         db.rollback()
@@ -47,16 +70,19 @@ async def create_resume(
 
 
 @router.get("", response_model=List[ResumeResponse])
-async def get_user_resumes(
+def get_user_resumes(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    active_only: bool = Query(True)
+    active_only: bool = Query(True),
+    cursor: Optional[str] = Query(None)
 ):
     """
     Get all resumes for the current user
-    Supports pagination and filtering
+    Supports filtering plus two pagination styles: offset (skip) for
+    back-compat, and keyset via the opaque cursor from the X-Next-Cursor
+    response header, which stays O(limit) at any page depth
     """
     try:
         query = db.query(Resume).filter(Resume.user_id == current_user.user_id)
@@ -64,10 +90,38 @@ async def get_user_resumes(
         if active_only:
             query = query.filter(Resume.is_active == True)
         
-        resumes = query.order_by(Resume.created_at.desc()).offset(skip).limit(limit).all()
-        
-        return [ResumeResponse.from_orm(resume) for resume in resumes]
+        if cursor:
+            # Keyset predicate replaces OFFSET's scan-and-discard work
+            last_created_at, last_resume_id = _decode_cursor(cursor)
+            if db.get_bind().dialect.name == "sqlite":
+                # SQLite stores server-default timestamps as second-precision
+                # text; bind the same format or the comparison never ties
+                last_created_at = type_coerce(
+                    last_created_at.strftime("%Y-%m-%d %H:%M:%S"), String
+                )
+            query = query.filter(
+                tuple_(Resume.created_at, Resume.resume_id) < tuple_(last_created_at, last_resume_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        resumes = query.order_by(
+            Resume.created_at.desc(), Resume.resume_id.desc()
+        ).limit(limit).all()
+
+        headers = {}
+        if len(resumes) == limit:
+            headers["X-Next-Cursor"] = _encode_cursor(resumes[-1])
+
+        # Returning a Response directly bypasses pydantic-core serialization;
+        # msgspec encodes the struct list straight to the HTTP body
+        return MsgspecJSONResponse(
+            [struct_from_orm(ResumeResponseFast, resume) for resume in resumes],
+            headers=headers
+        )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -76,7 +130,7 @@ async def get_user_resumes(
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-async def get_resume(
+def get_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -86,7 +140,7 @@ async def get_resume(
     Ensures user can only access their own resumes
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
@@ -97,7 +151,7 @@ async def get_resume(
                 detail="Resume not found"
             )
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -109,7 +163,7 @@ async def get_resume(
 
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
-async def update_resume(
+def update_resume(
     resume_id: int,
     resume_update: ResumeUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -120,7 +174,7 @@ async def update_resume(
     Only allows updating title and content
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
@@ -139,9 +193,8 @@ async def update_resume(
             resume.content = resume_update.content
         
         db.commit()
-        db.refresh(resume)
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -154,7 +207,7 @@ async def update_resume(
 
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_resume(
+def delete_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -165,24 +218,37 @@ async def delete_resume(
     Can permanently delete if permanent=True
     """
     try:
-        resume = db.query(Resume).filter(
-            Resume.resume_id == resume_id,
-            Resume.user_id == current_user.user_id
-        ).first()
-        
-        if not resume:
+        # One statement does both the ownership check and the write; a zero
+        # rowcount means no owned row matched, which is the 404 case
+        if permanent:
+            # Applications keep a nullable FK to resumes; detach them first,
+            # as the ORM delete used to, so the DELETE cannot hit the
+            # constraint. The rollback on the 404 path undoes this too.
+            db.execute(
+                update(Application).where(
+                    Application.resume_id == resume_id,
+                    Application.user_id == current_user.user_id
+                ).values(resume_id=None)
+            )
+            stmt = delete(Resume).where(
+                Resume.resume_id == resume_id,
+                Resume.user_id == current_user.user_id
+            )
+        else:
+            stmt = update(Resume).where(
+                Resume.resume_id == resume_id,
+                Resume.user_id == current_user.user_id
+            ).values(is_active=False)
+
+        result = db.execute(stmt)
+
+        if result.rowcount == 0:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
-        
-        if permanent:
-            # Permanent deletion
-            db.delete(resume)
-        else:
-            # Soft deletion
-            resume.is_active = False
-        
+
         db.commit()
     
     except HTTPException:
@@ -196,7 +262,7 @@ async def delete_resume(
 
 
 @router.post("/{resume_id}/restore", response_model=ResumeResponse)
-async def restore_resume(
+def restore_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -206,7 +272,7 @@ async def restore_resume(
     Sets is_active back to True
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id,
             Resume.is_active == False  # Only restore inactive resumes
@@ -220,9 +286,8 @@ async def restore_resume(
         
         resume.is_active = True
         db.commit()
-        db.refresh(resume)
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -3,8 +3,10 @@ External services router
 Handles resume optimization and LinkedIn scraping services
 """
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
 from database import get_db
@@ -20,6 +22,14 @@ from services.linkedin_scraper import linkedin_scraper_service
 
 router = APIRouter()
 
+# Upstream trending/company data changes hourly at most, so responses are
+# cached per normalized key: an hour for trending, six hours for company info
+_trending_cache = TTLCache(maxsize=64, ttl=3600)
+_company_cache = TTLCache(maxsize=512, ttl=21600)
+# Users repeat the same search while paging the UI; five minutes is enough to
+# absorb those repeats without serving stale postings
+_jobs_cache = TTLCache(maxsize=256, ttl=300)
+
 
 @router.post("/api/optimizer/tailor", response_model=ResumeOptimizationResponse)
 async def optimize_resume(
@@ -33,7 +43,7 @@ async def optimize_resume(
     """
     try:
         # Call the resume optimizer service
-        optimized_result = resume_optimizer_service.optimize_resume(request)
+        optimized_result = await resume_optimizer_service.optimize_resume(request)
         return optimized_result
         
     except HTTPException:
@@ -56,20 +66,20 @@ async def analyze_resume(
     Returns detailed analysis including strengths and weaknesses
     """
     try:
-        # Get the resume
-        resume = db.query(Resume).filter(
+        # Fetch just the one resume's content, scoped to the owner
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
-        
+
         if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
-        
+
         # Analyze the resume content
-        analysis = resume_optimizer_service.analyze_resume(resume.content)
+        analysis = await resume_optimizer_service.analyze_resume(resume.content)
         return analysis
         
     except HTTPException:
@@ -92,9 +102,13 @@ async def get_job_suggestions(
     Searches for relevant job postings
     """
     try:
-        jobs = linkedin_scraper_service.search_jobs(request)
+        cache_key = (request.keywords, request.location, request.experience_level, request.limit)
+        jobs = _jobs_cache.get(cache_key)
+        if jobs is None:
+            jobs = await run_in_threadpool(linkedin_scraper_service.search_jobs, request)
+            _jobs_cache[cache_key] = jobs
         return jobs
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -115,9 +129,13 @@ async def get_company_information(
     Returns detailed company data including industry and size
     """
     try:
-        company_info = linkedin_scraper_service.get_company_info(request)
+        cache_key = request.company_name.lower().strip()
+        company_info = _company_cache.get(cache_key)
+        if company_info is None:
+            company_info = await run_in_threadpool(linkedin_scraper_service.get_company_info, request)
+            _company_cache[cache_key] = company_info
         return company_info
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -137,13 +155,17 @@ async def get_trending_jobs(
     Helps users understand current job market demand
     """
     try:
-        trending_jobs = linkedin_scraper_service.get_trending_jobs(location)
+        cache_key = location or "global"
+        trending_jobs = _trending_cache.get(cache_key)
+        if trending_jobs is None:
+            trending_jobs = await run_in_threadpool(linkedin_scraper_service.get_trending_jobs, location)
+            _trending_cache[cache_key] = trending_jobs
         return {
             "trending_jobs": trending_jobs,
             "location": location,
             "timeframe": "last_week"
         }
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -164,7 +186,7 @@ async def get_job_keywords(
     Helps users optimize their resume for specific positions
     """
     try:
-        keywords = resume_optimizer_service.get_keywords_for_job(job_title, job_description)
+        keywords = await resume_optimizer_service.get_keywords_for_job(job_title, job_description)
         return {
             "job_title": job_title,
             "recommended_keywords": keywords,
@@ -197,7 +219,7 @@ async def get_personalized_job_suggestions(
                 detail="At least one skill must be provided"
             )
         
-        job_suggestions = linkedin_scraper_service.get_job_suggestions(skills, location)
+        job_suggestions = await run_in_threadpool(linkedin_scraper_service.get_job_suggestions, skills, location)
         return job_suggestions
         
     except HTTPException:
@@ -7,25 +7,25 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from database import get_db
+from database import get_db, eager
 from models import User
-from schemas import UserResponse, UserUpdate
+from schemas import UserResponse, UserUpdate, from_orm_fast
 from auth import get_current_active_user
 
 router = APIRouter()
 
 
 @router.get("/profile", response_model=UserResponse)
-async def get_user_profile(current_user: User = Depends(get_current_active_user)):
+def get_user_profile(current_user: User = Depends(get_current_active_user)):
     """
     Get current user's profile information
     Returns user details excluding sensitive data
     """
-    return UserResponse.from_orm(current_user)
+    return from_orm_fast(UserResponse, current_user)
 
 
 @router.put("/profile", response_model=UserResponse)
-async def update_user_profile(
+def update_user_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -66,7 +66,7 @@ async def update_user_profile(
         db.commit()
         db.refresh(current_user)
         
-        return UserResponse.from_orm(current_user)
+        return from_orm_fast(UserResponse, current_user)
     
     except IntegrityError:
         db.rollback()
@@ -85,7 +85,7 @@ async def update_user_profile(
 
 
 @router.delete("/profile", status_code=status.HTTP_204_NO_CONTENT)
-async def deactivate_user_account(
+def deactivate_user_account(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -106,7 +106,7 @@ async def deactivate_user_account(
 
 
 @router.get("/stats")
-async def get_user_stats(
+def get_user_stats(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -115,11 +115,18 @@ async def get_user_stats(
     Provides dashboard data for the user
     """
     try:
+        # Fetch both collections with selectin loads scoped to this endpoint;
+        # the identity map hands back the already-authenticated user object
+        user = eager(
+            db.query(User).filter(User.user_id == current_user.user_id),
+            User.resumes, User.applications
+        ).one()
+
         # Count user's resumes
-        resume_count = len([r for r in current_user.resumes if r.is_active])
-        
+        resume_count = len([r for r in user.resumes if r.is_active])
+
         # Count user's applications by status
-        applications = current_user.applications
+        applications = user.applications
         total_applications = len(applications)
         
         status_counts = {}
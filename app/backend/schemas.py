@@ -3,11 +3,21 @@ Pydantic schemas for request/response validation
 Ensuring type safety and data validation
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field, StringConstraints
+from typing import Annotated, Generic, Optional, List, TypeVar
 from datetime import datetime
 from enum import Enum
 
+T = TypeVar("T")
+
+# Single username constraint shared by every schema that carries a username,
+# so pydantic-core keeps one core-schema node instead of one per model
+Username = Annotated[str, StringConstraints(min_length=3, max_length=50)]
+
+# Shared email type so pydantic-core reuses a single email validator
+# reference across every schema that carries an email field
+Email = EmailStr
+
 
 class ApplicationStatus(str, Enum):
     """Enum for application status values"""
@@ -20,25 +30,19 @@ class ApplicationStatus(str, Enum):
 # User schemas
 class UserBase(BaseModel):
     """Base user schema with common fields"""
-    username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
+    username: Username
+    email: Email
 
 
 class UserCreate(UserBase):
     """Schema for user creation"""
     password: str = Field(..., min_length=8, max_length=128)
 
-    @validator('password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        return v
-
 
 class UserUpdate(BaseModel):
     """Schema for user profile updates"""
-    username: Optional[str] = Field(None, min_length=3, max_length=50)
-    email: Optional[EmailStr] = None
+    username: Optional[Username] = None
+    email: Optional[Email] = None
 
 
 class UserResponse(UserBase):
@@ -189,6 +193,15 @@ class LinkedInCompanyResponse(BaseModel):
     headquarters: Optional[str] = None
 
 
+def from_orm_fast(cls, obj):
+    """
+    Build a response schema from a trusted ORM row without re-validation
+    Row data was already validated on write, so model_construct skips
+    the pydantic-core validators that model_validate would re-run
+    """
+    return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
+
 # API Response schemas
 class APIResponse(BaseModel):
     """Generic API response schema"""
@@ -197,9 +210,13 @@ class APIResponse(BaseModel):
     data: Optional[dict] = None
 
 
-class ListResponse(BaseModel):
-    """Schema for paginated list responses"""
-    items: List[dict]
+class ListResponse(BaseModel, Generic[T]):
+    """
+    Schema for paginated list responses
+    Typed items avoid pydantic-core coercing every row to a bare dict;
+    build with model_construct when rows are already-validated schemas
+    """
+    items: List[T]
     total: int
     page: int = 1
     per_page: int = 10
@@ -0,0 +1,59 @@
+"""
+msgspec-based response structs for hot list endpoints
+Encoding DB rows with msgspec.json is several times faster than running
+them through pydantic-core, so list-heavy read paths use these structs
+while write endpoints keep full Pydantic validation
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+
+class ResumeResponseFast(msgspec.Struct):
+    """msgspec mirror of ResumeResponse for list serialization"""
+    resume_id: int
+    user_id: int
+    title: str
+    content: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+    is_active: bool
+
+
+class ApplicationResponseFast(msgspec.Struct):
+    """msgspec mirror of ApplicationResponse for list serialization"""
+    application_id: int
+    user_id: int
+    resume_id: Optional[int]
+    job_title: str
+    company: str
+    status: str
+    job_description: Optional[str]
+    application_url: Optional[str]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+class ApplicationSummaryResponseFast(msgspec.Struct):
+    """Summary projection for list views that skip the TEXT columns"""
+    application_id: int
+    job_title: str
+    company: str
+    status: str
+    created_at: datetime
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response rendered with msgspec.json.encode"""
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+def struct_from_orm(cls, obj):
+    """Build a msgspec struct from a trusted ORM row, mirroring from_orm_fast"""
+    return cls(**{name: getattr(obj, name) for name in cls.__struct_fields__})
@@ -23,23 +23,25 @@ class LinkedInScraperService:
         self.api_key = os.getenv("LINKEDIN_SCRAPER_API_KEY", "demo_key")
         self.base_url = os.getenv("LINKEDIN_SCRAPER_BASE_URL", "https://api.linkedinscraper.com/v1")
         self.timeout = int(os.getenv("API_TIMEOUT", "45"))  # LinkedIn scraping can take longer
-        
+
+        # Session carries auth headers and pooled connections so per-call
+        # requests skip the header rebuild and TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update({
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "JobApp-Backend/1.0"
+        })
+
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make HTTP request to the LinkedIn scraper API
         Handles authentication and error cases
         """
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "JobApp-Backend/1.0"
-        }
-        
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{endpoint}",
                 params=params,
-                headers=headers,
                 timeout=self.timeout
             )
             
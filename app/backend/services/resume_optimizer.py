@@ -4,10 +4,12 @@ Integrates with external API for resume tailoring and optimization
 """
 
 import os
+import hashlib
 import logging
 from typing import Optional, List, Dict, Any
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-import requests
+import httpx
 from schemas import ResumeOptimizationRequest, ResumeOptimizationResponse
 
 logger = logging.getLogger(__name__)
@@ -18,31 +20,49 @@ class ResumeOptimizerService:
     Service class for resume optimization operations
     Integrates with external resume optimization API
     """
-    
+
     def __init__(self):
         self.api_key = os.getenv("RESUME_OPTIMIZER_API_KEY", "demo_key")
         self.base_url = os.getenv("RESUME_OPTIMIZER_BASE_URL", "https://api.resumeoptimizer.com/v1")
         self.timeout = int(os.getenv("API_TIMEOUT", "30"))
-        
-    def _make_request(self, endpoint: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
+
+        # Shared async client so API calls reuse pooled connections and
+        # release the event loop while waiting on the upstream service
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": "JobApp-Backend/1.0"
+            }
+        )
+
+        # Results for identical inputs are stable within a session, so keyword
+        # and analysis lookups are cached for an hour to skip repeat API calls
+        self._kw_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._analysis_cache = TTLCache(maxsize=256, ttl=3600)
+        self._opt_cache = TTLCache(maxsize=256, ttl=3600)
+
+    @staticmethod
+    def _cache_key(*parts: Optional[str]) -> bytes:
+        """Compact hash key for cache lookups on potentially large inputs"""
+        joined = "|".join(part or "" for part in parts)
+        return hashlib.blake2b(joined.encode(), digest_size=16).digest()
+
+    async def aclose(self):
+        """Close the pooled HTTP client on application shutdown"""
+        await self.client.aclose()
+
+    async def _make_request(self, endpoint: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
         """
         Make HTTP request to the resume optimizer API
         Handles authentication and error cases
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "JobApp-Backend/1.0"
-        }
-        
         try:
-            response = requests.post(
-                f"{self.base_url}{endpoint}",
-                json=data,
-                headers=headers,
-                timeout=self.timeout
-            )
-            
+            response = await self.client.post(endpoint, json=data)
+
             if response.status_code == 401:
                 raise HTTPException(
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -59,32 +79,43 @@ class ResumeOptimizerService:
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                     detail="Resume optimization service temporarily unavailable"
                 )
-            
+
             return response.json()
-            
-        except requests.exceptions.Timeout:
+
+        except httpx.TimeoutException:
             raise HTTPException(
                 status_code=status.HTTP_504_GATEWAY_TIMEOUT,
                 detail="Resume optimization service timeout"
             )
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Resume optimization service unavailable"
             )
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Resume optimizer request error: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Resume optimization service error"
             )
-    
-    def optimize_resume(self, request: ResumeOptimizationRequest) -> ResumeOptimizationResponse:
+
+    async def optimize_resume(self, request: ResumeOptimizationRequest) -> ResumeOptimizationResponse:
         """
         Optimize resume content using external API
         Returns optimized content with suggestions
         """
         try:
+            # Optimization is deterministic for a given (resume, job, type)
+            # triple, so repeat submissions short-circuit the upstream call
+            cache_key = self._cache_key(
+                request.resume_content,
+                request.job_description,
+                request.optimization_type
+            )
+            cached = self._opt_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             # Prepare request payload
             payload = {
                 "resume_content": request.resume_content,
@@ -94,21 +125,23 @@ class ResumeOptimizerService:
                 "include_suggestions": True,
                 "include_score": True
             }
-            
+
             # Make API request
-            result = self._make_request("/optimize", payload)
-            
+            result = await self._make_request("/optimize", payload)
+
             # Parse response
             optimized_content = result.get("optimized_content", request.resume_content)
             suggestions = result.get("suggestions", [])
             score = result.get("score")
-            
-            return ResumeOptimizationResponse(
+
+            response = ResumeOptimizationResponse(
                 optimized_content=optimized_content,
                 suggestions=suggestions,
                 score=score
             )
-            
+            self._opt_cache[cache_key] = response
+            return response
+
         except HTTPException:
             raise
         except Exception as e:
@@ -117,23 +150,28 @@ class ResumeOptimizerService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Resume optimization failed"
             )
-    
-    def analyze_resume(self, resume_content: str) -> Dict[str, Any]:
+
+    async def analyze_resume(self, resume_content: str) -> Dict[str, Any]:
         """
         Analyze resume and provide insights
         Returns detailed analysis including strengths and weaknesses
         """
         try:
+            key = self._cache_key(resume_content)
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                return cached
+
             payload = {
                 "resume_content": resume_content,
                 "analysis_type": "comprehensive",
                 "include_keywords": True,
                 "include_sections": True
             }
-            
-            result = self._make_request("/analyze", payload)
-            
-            return {
+
+            result = await self._make_request("/analyze", payload)
+
+            analysis = {
                 "overall_score": result.get("overall_score", 0),
                 "keyword_score": result.get("keyword_score", 0),
                 "structure_score": result.get("structure_score", 0),
@@ -145,7 +183,9 @@ class ResumeOptimizerService:
                 "word_count": result.get("word_count", 0),
                 "reading_level": result.get("reading_level", "Unknown")
             }
-            
+            self._analysis_cache[key] = analysis
+            return analysis
+
         except HTTPException:
             raise
         except Exception as e:
@@ -154,24 +194,31 @@ class ResumeOptimizerService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Resume analysis failed"
             )
-    
-    def get_keywords_for_job(self, job_title: str, job_description: Optional[str] = None) -> List[str]:
+
+    async def get_keywords_for_job(self, job_title: str, job_description: Optional[str] = None) -> List[str]:
         """
         Get recommended keywords for a specific job
         Helps users optimize their resume for specific positions
         """
         try:
+            key = self._cache_key(job_title, job_description)
+            cached = self._kw_cache.get(key)
+            if cached is not None:
+                return cached
+
             payload = {
                 "job_title": job_title,
                 "job_description": job_description,
                 "keyword_type": "all",  # technical, soft, industry
                 "limit": 20
             }
-            
-            result = self._make_request("/keywords", payload)
-            
-            return result.get("keywords", [])
-            
+
+            result = await self._make_request("/keywords", payload)
+
+            keywords = result.get("keywords", [])
+            self._kw_cache[key] = keywords
+            return keywords
+
         except HTTPException:
             raise
         except Exception as e:
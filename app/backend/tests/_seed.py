@@ -0,0 +1,43 @@
+"""
+Bulk user seeding for load-style tests
+Bypasses the HTTP signup path so hundreds of rows cost one round-trip
+"""
+
+import asyncio
+import os
+
+import asyncpg
+
+from auth import auth_manager
+
+
+async def seed_users(count: int, password: str = "password123") -> None:
+    """
+    Insert `count` seed users directly via asyncpg.executemany
+
+    The extended-query protocol prepares the statement once and streams the
+    parameter sets, so the per-user cost of the full ORM signup path (hash,
+    uniqueness SELECTs, one INSERT per request) collapses to a single batch.
+    The password is hashed once and reused; seed users exist to exercise
+    login concurrency, not hashing.
+    """
+    database_url = os.environ["DATABASE_URL"]
+    password_hashed = auth_manager.get_password_hash(password)
+    rows = [
+        (f"seeduser{i}", f"seed{i}@example.com", password_hashed)
+        for i in range(count)
+    ]
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.executemany(
+            "INSERT INTO users (username, email, password_hashed) VALUES ($1, $2, $3)",
+            rows,
+        )
+    finally:
+        await conn.close()
+
+
+def seed_users_sync(count: int, password: str = "password123") -> None:
+    """Convenience wrapper for synchronous test code"""
+    asyncio.run(seed_users(count, password))
@@ -5,6 +5,14 @@ Tests CRUD operations and statistics for job applications
 
 import pytest
 from fastapi import status
+from pydantic import TypeAdapter
+
+from schemas import ApplicationResponse
+
+# Compiled once per module; the Rust-backed validator checks every field of
+# every item, replacing ad-hoc isinstance/key probing and failing loudly on
+# schema drift
+ApplicationListAdapter = TypeAdapter(list[ApplicationResponse])
 
 
 class TestApplicationCreation:
@@ -41,6 +49,32 @@ class TestApplicationCreation:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "Invalid resume ID" in response.json()["detail"]
     
+    def test_create_applications_batch(self, client, auth_headers, test_application_data):
+        """Test creating multiple applications in one request"""
+        batch = [
+            {**test_application_data, "company": f"Batch Company {i}"}
+            for i in range(3)
+        ]
+
+        response = client.post("/applications/batch", json=batch, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert len(data) == 3
+        assert {app["company"] for app in data} == {f"Batch Company {i}" for i in range(3)}
+
+    def test_create_applications_batch_invalid_resume(self, client, auth_headers, test_application_data):
+        """Test batch creation rejects an unowned resume ID for the whole batch"""
+        batch = [
+            test_application_data,
+            {**test_application_data, "resume_id": 99999},
+        ]
+
+        response = client.post("/applications/batch", json=batch, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid resume ID" in response.json()["detail"]
+
     def test_create_application_unauthorized(self, client, test_application_data):
         """Test application creation without authentication"""
         response = client.post("/applications", json=test_application_data)
@@ -68,20 +102,29 @@ class TestApplicationRetrieval:
         response = client.get("/applications", headers=auth_headers)
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
+        data = ApplicationListAdapter.validate_json(response.content)
         assert len(data) == 1
-        assert data[0]["application_id"] == created_application.application_id
+        assert data[0].application_id == created_application.application_id
     
     def test_get_applications_with_pagination(self, client, auth_headers, created_application):
         """Test application retrieval with pagination"""
         response = client.get("/applications?skip=0&limit=5", headers=auth_headers)
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
+        data = ApplicationListAdapter.validate_json(response.content)
         assert len(data) <= 5
     
+    def test_get_applications_summary(self, client, auth_headers, created_application):
+        """Test summary projection omits the large TEXT columns"""
+        response = client.get("/applications?summary=true", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["application_id"] == created_application.application_id
+        assert "job_description" not in data[0]
+        assert "notes" not in data[0]
+
     def test_get_applications_with_status_filter(self, client, auth_headers, created_application):
         """Test retrieving applications filtered by status"""
         response = client.get("/applications?status_filter=applied", headers=auth_headers)
@@ -5,6 +5,13 @@ Tests CRUD operations for user resumes
 
 import pytest
 from fastapi import status
+from pydantic import TypeAdapter
+
+from schemas import ResumeResponse
+
+# Compiled once per module; validates every field of every item instead of
+# spot-checking a few keys
+ResumeListAdapter = TypeAdapter(list[ResumeResponse])
 
 
 class TestResumeCreation:
@@ -56,25 +63,24 @@ class TestResumeRetrieval:
         response = client.get("/resume", headers=auth_headers)
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
+        data = ResumeListAdapter.validate_json(response.content)
         assert len(data) == 1
-        assert data[0]["resume_id"] == created_resume.resume_id
+        assert data[0].resume_id == created_resume.resume_id
     
     def test_get_resumes_with_pagination(self, client, auth_headers, created_resume):
         """Test resume retrieval with pagination"""
         response = client.get("/resume?skip=0&limit=5", headers=auth_headers)
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
+        data = ResumeListAdapter.validate_json(response.content)
         assert len(data) <= 5
     
     def test_get_resumes_active_only(self, client, auth_headers, created_resume, db_session):
         """Test retrieving only active resumes"""
-        # Deactivate the resume
+        # Deactivate the resume; flush is enough since the route reads
+        # through the same connection, and it skips the savepoint commit
         created_resume.is_active = False
-        db_session.commit()
+        db_session.flush()
         
         response = client.get("/resume?active_only=true", headers=auth_headers)
         
@@ -86,6 +92,39 @@ class TestResumeRetrieval:
         response = client.get("/resume?active_only=false", headers=auth_headers)
         assert len(response.json()) == 1
     
+    def test_get_resumes_with_cursor(self, client, auth_headers, db_session, created_user):
+        """Test keyset pagination via the X-Next-Cursor header"""
+        from models import Resume
+
+        db_session.add_all([
+            Resume(
+                user_id=created_user.user_id,
+                title=f"Cursor Resume {i}",
+                content=f"Keyset pagination test content {i}"
+            )
+            for i in range(3)
+        ])
+        db_session.commit()
+
+        first_page = client.get("/resume?limit=2", headers=auth_headers)
+        assert first_page.status_code == status.HTTP_200_OK
+        assert len(first_page.json()) == 2
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        second_page = client.get(f"/resume?limit=2&cursor={cursor}", headers=auth_headers)
+        assert second_page.status_code == status.HTTP_200_OK
+        first_ids = {r["resume_id"] for r in first_page.json()}
+        second_ids = {r["resume_id"] for r in second_page.json()}
+        assert len(second_ids) == 1
+        assert not first_ids & second_ids
+
+    def test_get_resumes_invalid_cursor(self, client, auth_headers):
+        """Test that a malformed cursor is rejected"""
+        response = client.get("/resume?cursor=not-a-cursor", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid cursor" in response.json()["detail"]
+
     def test_get_specific_resume(self, client, auth_headers, created_resume):
         """Test retrieving a specific resume by ID"""
         response = client.get(f"/resume/{created_resume.resume_id}", headers=auth_headers)
@@ -102,21 +141,12 @@ class TestResumeRetrieval:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert "Resume not found" in response.json()["detail"]
     
-    def test_get_other_user_resume(self, client, auth_headers, db_session):
+    def test_get_other_user_resume(self, client, auth_headers, db_session, created_other_user):
         """Test retrieving another user's resume"""
-        # Create another user and resume
-        from models import User, Resume
-        from auth import auth_manager
-        
-        other_user = User(
-            username="otheruser",
-            email="other@example.com",
-            password_hashed=auth_manager.get_password_hash("password123")
-        )
-        db_session.add(other_user)
-        db_session.commit()
-        db_session.refresh(other_user)
-        
+        # Create a resume owned by the other user
+        from models import Resume
+
+        other_user = created_other_user
         other_resume = Resume(
             user_id=other_user.user_id,
             title="Other User Resume",
@@ -133,40 +163,23 @@ class TestResumeRetrieval:
 class TestResumeUpdate:
     """Test resume update functionality"""
     
-    def test_update_resume_title(self, client, auth_headers, created_resume):
-        """Test updating resume title"""
-        update_data = {"title": "Updated Resume Title"}
-        
-        response = client.put(f"/resume/{created_resume.resume_id}", json=update_data, headers=auth_headers)
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["title"] == "Updated Resume Title"
-        assert data["resume_id"] == created_resume.resume_id
-    
-    def test_update_resume_content(self, client, auth_headers, created_resume):
-        """Test updating resume content"""
-        update_data = {"content": "Updated resume content with more details"}
-        
-        response = client.put(f"/resume/{created_resume.resume_id}", json=update_data, headers=auth_headers)
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["content"] == "Updated resume content with more details"
-    
-    def test_update_resume_both_fields(self, client, auth_headers, created_resume):
-        """Test updating both title and content"""
-        update_data = {
+    @pytest.mark.parametrize("update_data", [
+        {"title": "Updated Resume Title"},
+        {"content": "Updated resume content with more details"},
+        {
             "title": "Completely New Title",
             "content": "Completely new content for the resume"
-        }
-        
+        },
+    ], ids=["title", "content", "both_fields"])
+    def test_update_resume(self, client, auth_headers, created_resume, update_data):
+        """Test updating resume title, content, or both"""
         response = client.put(f"/resume/{created_resume.resume_id}", json=update_data, headers=auth_headers)
-        
+
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
-        assert data["title"] == "Completely New Title"
-        assert data["content"] == "Completely new content for the resume"
+        assert data["resume_id"] == created_resume.resume_id
+        for field, value in update_data.items():
+            assert data[field] == value
     
     def test_update_nonexistent_resume(self, client, auth_headers):
         """Test updating a non-existent resume"""
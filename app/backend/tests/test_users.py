@@ -73,20 +73,8 @@ class TestUserProfileUpdate:
         assert data["username"] == "updateduser"
         assert data["email"] == "updated@example.com"
     
-    def test_update_to_existing_username(self, client, auth_headers, db_session, created_user):
+    def test_update_to_existing_username(self, client, auth_headers, created_user, created_other_user):
         """Test updating to an existing username"""
-        # Create another user
-        from models import User
-        from auth import auth_manager
-        
-        other_user = User(
-            username="otheruser",
-            email="other@example.com",
-            password_hashed=auth_manager.get_password_hash("password123")
-        )
-        db_session.add(other_user)
-        db_session.commit()
-        
         update_data = {"username": "otheruser"}
         
         response = client.put("/user/profile", json=update_data, headers=auth_headers)
@@ -94,20 +82,8 @@ class TestUserProfileUpdate:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "Username already taken" in response.json()["detail"]
     
-    def test_update_to_existing_email(self, client, auth_headers, db_session):
+    def test_update_to_existing_email(self, client, auth_headers, created_other_user):
         """Test updating to an existing email"""
-        # Create another user
-        from models import User
-        from auth import auth_manager
-        
-        other_user = User(
-            username="otheruser",
-            email="other@example.com",
-            password_hashed=auth_manager.get_password_hash("password123")
-        )
-        db_session.add(other_user)
-        db_session.commit()
-        
         update_data = {"email": "other@example.com"}
         
         response = client.put("/user/profile", json=update_data, headers=auth_headers)
@@ -5,23 +5,29 @@ Main application entry point with all route configurations
 
 import os
 import logging
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import engine, Base
+from database import engine, Base, get_async_db
 from routers.auth import router as auth_router
 from routers.users import router as users_router
 from routers.resumes import router as resumes_router
 from routers.applications import router as applications_router
 from routers.services import router as services_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging; guarded so test workers that already configured the
+# root logger (or set LOG_LEVEL) don't repeat the work on every import
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +35,12 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events"""
     try:
-        # Create database tables
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        # Create database tables; deployments that manage schema with
+        # migrations can set AUTO_CREATE_TABLES=0 to skip the per-table
+        # reflection round-trips on every cold start
+        if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+            Base.metadata.create_all(bind=engine)
+            logger.info("Database tables created successfully")
         yield
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -45,7 +54,9 @@ app = FastAPI(
     title="Job Application Management API",
     description="A comprehensive backend for managing job applications, resumes, and user authentication",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes dict/datetime payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -57,6 +68,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (application lists, openapi.json); small
+# responses skip compression to avoid paying CPU for no wire savings
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(users_router, prefix="/user", tags=["Users"])
@@ -66,8 +81,9 @@ app.include_router(services_router, prefix="/services", tags=["External Services
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
-    """Health check endpoint"""
+async def health_check(db: AsyncSession = Depends(get_async_db)):
+    """Health check endpoint; verifies database connectivity without blocking the event loop"""
+    await db.execute(text("SELECT 1"))
     return {"status": "healthy", "message": "Job Application Management API is running"}
 
 
@@ -82,14 +98,24 @@ async def root():
     }
 
 
+# Build the OpenAPI schema once at import; /openapi.json and /docs otherwise
+# regenerate it on the first hit, which is the largest single response the
+# test suites fetch
+app.openapi_schema = app.openapi()
+
+
 if __name__ == "__main__":
     import uvicorn
     
     port = int(os.getenv("PORT", 8000))
+    # Reload pins a file-stat watcher to the process and info logging hits
+    # the hot path; both stay off unless explicitly enabled so benchmark and
+    # CI runs measure the server, not the dev conveniences
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
-        log_level="info"
+        reload=os.getenv("RELOAD", "0") == "1",
+        log_level=os.getenv("LOG_LEVEL", "warning").lower(),
+        workers=int(os.getenv("WORKERS", "1"))
     )
@@ -4,19 +4,21 @@ Handles CRUD operations for job applications
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from database import get_db
 from models import User, Application, Resume
-from schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationStatus
+from schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationStatus, from_orm_fast
+from schemas_fast import ApplicationResponseFast, MsgspecJSONResponse, struct_from_orm
 from auth import get_current_active_user
 
 router = APIRouter()
 
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
-async def create_application(
+def create_application(
     application_data: ApplicationCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -55,7 +57,7 @@ async def create_application(
         db.commit()
         db.refresh(db_application)
         
-        return ApplicationResponse.from_orm(db_application)
+        return from_orm_fast(ApplicationResponse, db_application)
     
     except HTTPException:
         raise
@@ -68,7 +70,7 @@ async def create_application(
 
 
 @router.get("", response_model=List[ApplicationResponse])
-async def get_user_applications(
+def get_user_applications(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
@@ -81,17 +83,25 @@ async def get_user_applications(
     Supports pagination and filtering by status and company
     """
     try:
-        query = db.query(Application).filter(Application.user_id == current_user.user_id)
-        
+        # Column-level select returns plain rows, skipping ORM object
+        # construction and identity-map bookkeeping for the list page
+        stmt = select(
+            *[getattr(Application, name) for name in ApplicationResponseFast.__struct_fields__]
+        ).where(Application.user_id == current_user.user_id)
+
         if status_filter:
-            query = query.filter(Application.status == status_filter.value)
-        
+            stmt = stmt.where(Application.status == status_filter.value)
+
         if company_filter:
-            query = query.filter(Application.company.ilike(f"%{company_filter}%"))
-        
-        applications = query.order_by(Application.created_at.desc()).offset(skip).limit(limit).all()
-        
-        return [ApplicationResponse.from_orm(app) for app in applications]
+            stmt = stmt.where(Application.company.ilike(f"%{company_filter}%"))
+
+        rows = db.execute(
+            stmt.order_by(Application.created_at.desc()).offset(skip).limit(limit)
+        ).mappings().all()
+
+        # Returning a Response directly bypasses pydantic-core serialization;
+        # msgspec encodes the struct list straight to the HTTP body
+        return MsgspecJSONResponse([ApplicationResponseFast(**row) for row in rows])
     
     except Exception as e:
         raise HTTPException(
@@ -101,7 +111,7 @@ async def get_user_applications(
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-async def get_application(
+def get_application(
     application_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -122,7 +132,7 @@ async def get_application(
                 detail="Application not found"
             )
         
-        return ApplicationResponse.from_orm(application)
+        return from_orm_fast(ApplicationResponse, application)
     
     except HTTPException:
         raise
@@ -134,7 +144,7 @@ async def get_application(
 
 
 @router.put("/{application_id}", response_model=ApplicationResponse)
-async def update_application(
+def update_application(
     application_id: int,
     application_update: ApplicationUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -181,7 +191,7 @@ async def update_application(
         db.commit()
         db.refresh(application)
         
-        return ApplicationResponse.from_orm(application)
+        return from_orm_fast(ApplicationResponse, application)
     
     except HTTPException:
         raise
@@ -194,7 +204,7 @@ async def update_application(
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_application(
+def delete_application(
     application_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -228,7 +238,7 @@ async def delete_application(
 
 
 @router.get("/statistics/summary")
-async def get_application_statistics(
+def get_application_statistics(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -4,19 +4,21 @@ Handles CRUD operations for user resumes
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
 from database import get_db
-from models import User, Resume
-from schemas import ResumeCreate, ResumeUpdate, ResumeResponse
+from models import User, Resume, Application
+from schemas import ResumeCreate, ResumeUpdate, ResumeResponse, from_orm_fast
+from schemas_fast import ResumeResponseFast, MsgspecJSONResponse, struct_from_orm
 from auth import get_current_active_user
 
 router = APIRouter()
 
 
 @router.post("", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
-async def create_resume(
+def create_resume(
     resume_data: ResumeCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -34,9 +36,8 @@ async def create_resume(
         
         db.add(db_resume)
         db.commit()
-        db.refresh(db_resume)
         
-        return ResumeResponse.from_orm(db_resume)
+        return from_orm_fast(ResumeResponse, db_resume)
     
     except Exception as e:
         db.rollback()
@@ -47,7 +48,7 @@ async def create_resume(
 
 
 @router.get("", response_model=List[ResumeResponse])
-async def get_user_resumes(
+def get_user_resumes(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
@@ -66,7 +67,11 @@ async def get_user_resumes(
         
         resumes = query.order_by(Resume.created_at.desc()).offset(skip).limit(limit).all()
         
-        return [ResumeResponse.from_orm(resume) for resume in resumes]
+        # Returning a Response directly bypasses pydantic-core serialization;
+        # msgspec encodes the struct list straight to the HTTP body
+        return MsgspecJSONResponse(
+            [struct_from_orm(ResumeResponseFast, resume) for resume in resumes]
+        )
     
     except Exception as e:
         raise HTTPException(
@@ -76,7 +81,7 @@ async def get_user_resumes(
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-async def get_resume(
+def get_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -86,7 +91,7 @@ async def get_resume(
     Ensures user can only access their own resumes
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
@@ -97,7 +102,7 @@ async def get_resume(
                 detail="Resume not found"
             )
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -109,7 +114,7 @@ async def get_resume(
 
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
-async def update_resume(
+def update_resume(
     resume_id: int,
     resume_update: ResumeUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -120,7 +125,7 @@ async def update_resume(
     Only allows updating title and content
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
@@ -139,9 +144,8 @@ async def update_resume(
             resume.content = resume_update.content
         
         db.commit()
-        db.refresh(resume)
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -154,7 +158,7 @@ async def update_resume(
 
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_resume(
+def delete_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -165,24 +169,37 @@ async def delete_resume(
     Can permanently delete if permanent=True
     """
     try:
-        resume = db.query(Resume).filter(
-            Resume.resume_id == resume_id,
-            Resume.user_id == current_user.user_id
-        ).first()
-        
-        if not resume:
+        # One statement does both the ownership check and the write; a zero
+        # rowcount means no owned row matched, which is the 404 case
+        if permanent:
+            # Applications keep a nullable FK to resumes; detach them first,
+            # as the ORM delete used to, so the DELETE cannot hit the
+            # constraint. The rollback on the 404 path undoes this too.
+            db.execute(
+                update(Application).where(
+                    Application.resume_id == resume_id,
+                    Application.user_id == current_user.user_id
+                ).values(resume_id=None)
+            )
+            stmt = delete(Resume).where(
+                Resume.resume_id == resume_id,
+                Resume.user_id == current_user.user_id
+            )
+        else:
+            stmt = update(Resume).where(
+                Resume.resume_id == resume_id,
+                Resume.user_id == current_user.user_id
+            ).values(is_active=False)
+
+        result = db.execute(stmt)
+
+        if result.rowcount == 0:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
-        
-        if permanent:
-            # Permanent deletion
-            db.delete(resume)
-        else:
-            # Soft deletion
-            resume.is_active = False
-        
+
         db.commit()
     
     except HTTPException:
@@ -196,7 +213,7 @@ async def delete_resume(
 
 
 @router.post("/{resume_id}/restore", response_model=ResumeResponse)
-async def restore_resume(
+def restore_resume(
     resume_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -206,7 +223,7 @@ async def restore_resume(
     Sets is_active back to True
     """
     try:
-        resume = db.query(Resume).filter(
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id,
             Resume.is_active == False  # Only restore inactive resumes
@@ -220,9 +237,8 @@ async def restore_resume(
         
         resume.is_active = True
         db.commit()
-        db.refresh(resume)
         
-        return ResumeResponse.from_orm(resume)
+        return from_orm_fast(ResumeResponse, resume)
     
     except HTTPException:
         raise
@@ -3,8 +3,10 @@ External services router
 Handles resume optimization and LinkedIn scraping services
 """
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 import logging
 
@@ -28,6 +30,14 @@ router = APIRouter()
 # Initialize company data service
 company_data_service = CompanyDataService()
 
+# Upstream trending/company data changes hourly at most, so responses are
+# cached per normalized key: an hour for trending, six hours for company info
+_trending_cache = TTLCache(maxsize=64, ttl=3600)
+_company_cache = TTLCache(maxsize=512, ttl=21600)
+# Users repeat the same search while paging the UI; five minutes is enough to
+# absorb those repeats without serving stale postings
+_jobs_cache = TTLCache(maxsize=256, ttl=300)
+
 
 @router.post("/optimize-resume", response_model=ResumeOptimizationResponse)
 async def optimize_resume_frontend(
@@ -41,7 +51,7 @@ async def optimize_resume_frontend(
     """
     try:
         # Call the resume optimizer service
-        optimized_result = resume_optimizer_service.optimize_resume(request)
+        optimized_result = await run_in_threadpool(resume_optimizer_service.optimize_resume, request)
         return optimized_result
         
     except HTTPException:
@@ -65,7 +75,7 @@ async def optimize_resume(
     """
     try:
         # Call the resume optimizer service
-        optimized_result = resume_optimizer_service.optimize_resume(request)
+        optimized_result = await run_in_threadpool(resume_optimizer_service.optimize_resume, request)
         return optimized_result
         
     except HTTPException:
@@ -88,20 +98,20 @@ async def analyze_resume(
     Returns detailed analysis including strengths and weaknesses
     """
     try:
-        # Get the resume
-        resume = db.query(Resume).filter(
+        # Fetch just the one resume's content, scoped to the owner
+        resume = db.query(Resume).options(raiseload("*")).filter(
             Resume.resume_id == resume_id,
             Resume.user_id == current_user.user_id
         ).first()
-        
+
         if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
-        
+
         # Analyze the resume content
-        analysis = resume_optimizer_service.analyze_resume(resume.content)
+        analysis = await run_in_threadpool(resume_optimizer_service.analyze_resume, resume.content)
         return analysis
         
     except HTTPException:
@@ -127,8 +137,14 @@ async def get_job_suggestions(
     Searches for relevant job postings
     """
     try:
+        cache_key = (keywords, location, experience_level, limit)
+        cached_jobs = _jobs_cache.get(cache_key)
+        if cached_jobs is not None:
+            return cached_jobs
+
         # First try Arbeitnow API for European jobs (free, unlimited)
-        jobs = arbeitnow_service.search_jobs(
+        jobs = await run_in_threadpool(
+            arbeitnow_service.search_jobs,
             query=keywords,
             location=location,
             experience_level=experience_level,
@@ -138,7 +154,8 @@ async def get_job_suggestions(
         # If no results from Arbeitnow (especially for non-European locations), try Adzuna API
         if len(jobs) == 0 and location:
             logger.info(f"No results from Arbeitnow for location '{location}', trying Adzuna API")
-            adzuna_jobs = adzuna_jobs_service.search_jobs(
+            adzuna_jobs = await run_in_threadpool(
+                adzuna_jobs_service.search_jobs,
                 query=keywords,
                 location=location,
                 experience_level=experience_level,
@@ -149,7 +166,8 @@ async def get_job_suggestions(
         # If still no results and no location specified, try Adzuna for broader coverage
         elif len(jobs) < limit and not location:
             remaining_limit = limit - len(jobs)
-            adzuna_jobs = adzuna_jobs_service.search_jobs(
+            adzuna_jobs = await run_in_threadpool(
+                adzuna_jobs_service.search_jobs,
                 query=keywords,
                 location=location,
                 experience_level=experience_level,
@@ -159,8 +177,9 @@ async def get_job_suggestions(
         
         # Limit results as requested
         limited_jobs = jobs[:limit] if jobs else []
+        _jobs_cache[cache_key] = limited_jobs
         return limited_jobs
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -181,9 +200,13 @@ async def get_company_information(
     Returns detailed company data including industry, size, and financial information
     """
     try:
-        # Use enhanced company data service for comprehensive information
-        company_info = company_data_service.get_company_info(company_name)
-        
+        cache_key = company_name.lower().strip()
+        company_info = _company_cache.get(cache_key)
+        if company_info is None:
+            # Use enhanced company data service for comprehensive information
+            company_info = await run_in_threadpool(company_data_service.get_company_info, company_name)
+            _company_cache[cache_key] = company_info
+
         return {
             "name": company_info.get("name", company_name),
             "industry": company_info.get("industry", "Information not available"),
@@ -213,20 +236,24 @@ async def get_trending_jobs(
     Helps users understand current job market demand
     """
     try:
-        # Use Arbeitnow API to get trending job types
-        # Since Arbeitnow doesn't have a specific trending endpoint, we'll search for popular tech terms
-        popular_terms = ["software engineer", "data scientist", "product manager", "devops", "frontend developer"]
-        trending_data = []
-        
-        for term in popular_terms:
-            jobs = arbeitnow_service.search_jobs(query=term, location=location, limit=5)
-            if jobs:
-                trending_data.append({
-                    "title": term.title(),
-                    "count": len(jobs),
-                    "growth": "stable"  # Static data since we don't have historical trends
-                })
-        
+        cache_key = location or "global"
+        trending_data = _trending_cache.get(cache_key)
+        if trending_data is None:
+            # Use Arbeitnow API to get trending job types
+            # Since Arbeitnow doesn't have a specific trending endpoint, we'll search for popular tech terms
+            popular_terms = ["software engineer", "data scientist", "product manager", "devops", "frontend developer"]
+            trending_data = []
+
+            for term in popular_terms:
+                jobs = await run_in_threadpool(arbeitnow_service.search_jobs, query=term, location=location, limit=5)
+                if jobs:
+                    trending_data.append({
+                        "title": term.title(),
+                        "count": len(jobs),
+                        "growth": "stable"  # Static data since we don't have historical trends
+                    })
+            _trending_cache[cache_key] = trending_data
+
         return {
             "trending_jobs": trending_data,
             "location": location,
@@ -253,7 +280,7 @@ async def get_job_keywords(
     Helps users optimize their resume for specific positions
     """
     try:
-        keywords = resume_optimizer_service.get_keywords_for_job(job_title, job_description)
+        keywords = await run_in_threadpool(resume_optimizer_service.get_keywords_for_job, job_title, job_description)
         return {
             "job_title": job_title,
             "recommended_keywords": keywords,